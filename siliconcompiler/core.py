@@ -3,6 +3,7 @@
 import argparse
 import time
 import multiprocessing
+import multiprocessing.connection
 import tarfile
 import os
 import git
@@ -15,10 +16,13 @@ import logging
 import hashlib
 import shutil
 import copy
+import concurrent.futures
+import functools
 import importlib
 import inspect
 import textwrap
 import math
+import operator
 import pkgutil
 import graphviz
 import shlex
@@ -48,6 +52,22 @@ import subprocess
 import glob
 
 
+# Supported relational operations for _safecompare()
+_COMPARE_OPS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+_IS_POSIX = (sys.platform != 'win32')
+
+# Characters that require a tool option to be split with shlex
+_UNSAFE_OPTION_CHARS = re.compile(r'[^\w@%+=:,./ -]', flags=re.ASCII)
+
+
 class Chip:
     """Object for configuring and executing hardware design flows.
 
@@ -442,7 +462,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                                             action='append',
                                             help=helpstr,
                                             default=argparse.SUPPRESS)
-                elif re.match(r'\[', typestr) or pernodestr != 'never':
+                elif typestr.startswith('[') or pernodestr != 'never':
                     # list type arguments
                     parser.add_argument(*switchstrs,
                                         metavar=metavar,
@@ -1030,7 +1050,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         '''
         keypath = args[:-1]
         value = args[-1]
-        self.logger.debug(f'Setting {keypath} to {value}')
+        self.logger.debug('Setting %s to %s', keypath, value)
 
         # Special case to ensure loglevel is updated ASAP
         if keypath == ['option', 'loglevel'] and field == 'value' and \
@@ -1103,7 +1123,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         '''
         keypath = args[:-1]
         value = args[-1]
-        self.logger.debug(f'Appending value {value} to {keypath}')
+        self.logger.debug('Appending value %s to %s', value, keypath)
 
         try:
             self.schema.add(*args, field=field, step=step, index=index)
@@ -1318,7 +1338,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
             self.error('Can only call find_files on file or dir types')
             return None
 
-        is_list = bool(re.match(r'\[', paramtype))
+        is_list = paramtype.startswith('[')
 
         paths = self.schema.get(*keypath, job=job, step=step, index=index)
         # Convert to list if we have scalar
@@ -1522,7 +1542,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                     self.logger.warning(f'Keypath {keylist} is not valid')
             if key_valid and 'default' not in keylist:
                 typestr = src.get(*keylist, field='type')
-                should_append = re.match(r'\[', typestr) and not clear
+                should_append = typestr.startswith('[') and not clear
                 for val, step, index in src._getvals(*keylist, return_defvalue=False):
                     # update value, handling scalars vs. lists
                     if should_append:
@@ -2450,8 +2470,8 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 # skip history
                 continue
             leaftype = self.get(*key, field='type')
-            is_dir = re.search('dir', leaftype)
-            is_file = re.search('file', leaftype)
+            is_dir = 'dir' in leaftype
+            is_file = 'file' in leaftype
             if is_dir or is_file:
                 copy = self.get(*key, field='copy')
                 if copyall or copy:
@@ -2634,19 +2654,23 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
             return []
 
         # cycle through all paths
-        hashlist = []
         if filelist:
             self.logger.info(f'Computing hash value for [{keypathstr}]')
+        hashfiles = []
         for filename in filelist:
             if os.path.isfile(filename):
-                hashobj = hashfunc()
-                with open(filename, "rb") as f:
-                    for byte_block in iter(lambda: f.read(4096), b""):
-                        hashobj.update(byte_block)
-                hash_value = hashobj.hexdigest()
-                hashlist.append(hash_value)
+                hashfiles.append(filename)
             else:
                 self.error("Internal hashing error, file not found")
+
+        if len(hashfiles) <= 1:
+            hashlist = [self._hash_file(path, hashfunc) for path in hashfiles]
+        else:
+            # hash files concurrently, hashlib releases the GIL while digesting
+            max_workers = min(len(hashfiles), os.cpu_count() or 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hashlist = list(executor.map(lambda path: self._hash_file(path, hashfunc),
+                                             hashfiles))
         # compare previous hash to new hash
         oldhash = self.schema.get(*keypath, step=step, index=index, field='filehash')
         for i, item in enumerate(oldhash):
@@ -2658,6 +2682,28 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
 
         return hashlist
 
+    ###########################################################################
+    @staticmethod
+    def _hash_file(filename, hashfunc):
+        '''
+        Returns the hex digest of a file computed with hashfunc
+        '''
+        with open(filename, "rb") as f:
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+ digests directly from the file descriptor
+                return hashlib.file_digest(f, hashfunc).hexdigest()
+
+            hashobj = hashfunc()
+            # read file through a reusable 1 MiB buffer
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hashobj.update(view[:size])
+        return hashobj.hexdigest()
+
     ###########################################################################
     def audit_manifest(self):
         '''Verifies the integrity of the post-run compilation manifest.
@@ -3344,12 +3390,11 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
     def _setup_workdir(self, step, index, replay):
         workdir = self._getworkdir(step=step, index=index)
 
-        if os.path.isdir(workdir) and not replay:
+        if os.path.isdir(workdir) and not replay and os.listdir(workdir):
             shutil.rmtree(workdir)
-        os.makedirs(workdir, exist_ok=True)
-        os.makedirs(os.path.join(workdir, 'inputs'), exist_ok=True)
-        os.makedirs(os.path.join(workdir, 'outputs'), exist_ok=True)
-        os.makedirs(os.path.join(workdir, 'reports'), exist_ok=True)
+        # Creating the subdirectories also creates workdir itself
+        for subdir in ('inputs', 'outputs', 'reports'):
+            os.makedirs(os.path.join(workdir, subdir), exist_ok=True)
         return workdir
 
     def _merge_input_dependencies_manifests(self, step, index, status, replay):
@@ -3397,12 +3442,14 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         design = self.get('design')
         flow = self.get('option', 'flow')
         in_job = self._get_in_job(step, index)
-        if not self.get('flowgraph', flow, step, index, 'input'):
+        inputs = self.get('flowgraph', flow, step, index, 'input')
+        selected = self.get('flowgraph', flow, step, index, 'select')
+        if not inputs:
             all_inputs = []
-        elif not self.get('flowgraph', flow, step, index, 'select'):
-            all_inputs = self.get('flowgraph', flow, step, index, 'input')
+        elif not selected:
+            all_inputs = inputs
         else:
-            all_inputs = self.get('flowgraph', flow, step, index, 'select')
+            all_inputs = selected
         for in_step, in_index in all_inputs:
             if self.get('flowgraph', flow, in_step, in_index, 'status') == NodeStatus.ERROR:
                 self.logger.error(f'Halting step due to previous error in {in_step}{in_index}')
@@ -3430,22 +3477,28 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 self.logger.error(f"Pre-processing failed for '{tool}/{task}'")
                 self._haltstep(flow, step, index)
 
-    def _set_env_vars(self, step, index):
+    def _get_task_env(self, step, index):
+        '''
+        Returns a copy of the current environment with the task's variables set
+        '''
         flow = self.get('option', 'flow')
         tool, task = self._get_tool_task(step, index, flow)
+        env = os.environ.copy()
         # License file configuration.
         for item in self.getkeys('tool', tool, 'licenseserver'):
             license_file = self.get('tool', tool, 'licenseserver', item, step=step, index=index)
             if license_file:
-                os.environ[item] = ':'.join(license_file)
+                env[item] = ':'.join(license_file)
 
         # Tool-specific environment variables for this task.
         for item in self.getkeys('tool', tool, 'task', task, 'env'):
             val = self.get('tool', tool, 'task', task, 'env', item, step=step, index=index)
             if val:
-                os.environ[item] = val
+                env[item] = val
 
-    def _check_tool_version(self, step, index, run_func=None):
+        return env
+
+    def _check_tool_version(self, step, index, env, run_func=None):
         '''
         Check exe version
         '''
@@ -3463,6 +3516,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 cmdlist = [exe]
                 cmdlist.extend(veropt)
                 proc = subprocess.run(cmdlist,
+                                      env=env,
                                       stdout=subprocess.PIPE,
                                       stderr=subprocess.STDOUT,
                                       universal_newlines=True)
@@ -3498,14 +3552,22 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         Handle directing tool outputs to logger
         '''
         if not quiet:
-            if is_stdout_log:
+            if is_stdout_log and self.__has_unread_data(stdout_reader):
                 for line in stdout_reader.readlines():
                     self.logger.info(line.rstrip())
-            if is_stderr_log:
+            if is_stderr_log and self.__has_unread_data(stderr_reader):
                 for line in stderr_reader.readlines():
                     self.logger.error(line.rstrip())
 
-    def _run_executable_or_builtin(self, step, index, version, toolpath, workdir, run_func=None):
+    @staticmethod
+    def __has_unread_data(reader):
+        '''
+        Returns True if the file behind reader has grown past what was read
+        '''
+        return os.fstat(reader.fileno()).st_size > reader.buffer.tell()
+
+    def _run_executable_or_builtin(self, step, index, version, toolpath, workdir, env,
+                                   run_func=None):
         '''
         Run executable (or copy inputs to outputs for builtin functions)
         '''
@@ -3514,10 +3576,8 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         top = self.top()
         tool, task = self._get_tool_task(step, index, flow)
 
-        quiet = (
-            self.get('option', 'quiet', step=step, index=index) and not
-            self.get('option', 'breakpoint', step=step, index=index)
-        )
+        is_breakpoint = self.get('option', 'breakpoint', step=step, index=index)
+        quiet = self.get('option', 'quiet', step=step, index=index) and not is_breakpoint
 
         # TODO: Currently no memory usage tracking in breakpoints, builtins, or unexpected errors.
         max_mem_bytes = 0
@@ -3543,8 +3603,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
             self.logger.info('%s', printable_cmd)
             timeout = self.get('flowgraph', flow, step, index, 'timeout')
             logfile = step + '.log'
-            if sys.platform in ('darwin', 'linux') and \
-               self.get('option', 'breakpoint', step=step, index=index):
+            if sys.platform in ('darwin', 'linux') and is_breakpoint:
                 # When we break on a step, the tool often drops into a shell.
                 # However, our usual subprocess scheme seems to break terminal
                 # echo for some tools. On POSIX-compatible systems, we can use
@@ -3559,6 +3618,8 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                         log_writer.write(data)
                         return data
                     import pty  # Note: this import throws exception on Windows
+                    # pty.spawn() always inherits the environment of this process
+                    os.environ.update(env)
                     retcode = pty.spawn(cmdlist, read)
             else:
                 stdout_file = ''
@@ -3600,8 +3661,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                     # Use separate reader/writer file objects as hack to display
                     # live output in non-blocking way, so we can monitor the
                     # timeout. Based on https://stackoverflow.com/a/18422264.
-                    is_stdout_log = self.get('tool', tool, 'task', task, 'stdout', 'destination',
-                                             step=step, index=index) == 'log'
+                    is_stdout_log = stdout_destination == 'log'
                     is_stderr_log = stderr_destination == 'log' and stderr_file != stdout_file
                     # if STDOUT and STDERR are to be redirected to the same file,
                     # use a single writer
@@ -3612,6 +3672,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
 
                     cmd_start_time = time.time()
                     proc = subprocess.Popen(cmdlist,
+                                            env=env,
                                             stdout=stdout_writer,
                                             stderr=stderr_writer)
                     # How long to wait for proc to quit on ctrl-c before force
@@ -3645,14 +3706,18 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                                 self.logger.error(f'Step timed out after {timeout} seconds')
                                 utils.terminate_process(proc.pid)
                                 self._haltstep(flow, step, index)
-                            time.sleep(POLL_INTERVAL)
+
+                            # Wait on the process rather than sleeping, so the
+                            # loop ends as soon as the tool exits.
+                            try:
+                                proc.wait(timeout=POLL_INTERVAL)
+                            except subprocess.TimeoutExpired:
+                                pass
                     except KeyboardInterrupt:
-                        interrupt_time = time.time()
                         self.logger.info(f'Received ctrl-c, waiting for {tool} to exit...')
-                        while proc.poll() is None and \
-                                (time.time() - interrupt_time) < TERMINATE_TIMEOUT:
-                            time.sleep(5 * POLL_INTERVAL)
-                        if proc.poll() is None:
+                        try:
+                            proc.wait(timeout=TERMINATE_TIMEOUT)
+                        except subprocess.TimeoutExpired:
                             self.logger.warning(f'{tool} did not exit within {TERMINATE_TIMEOUT} '
                                                 'seconds. Terminating...')
                             utils.terminate_process(proc.pid)
@@ -3800,10 +3865,10 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         tool, _ = self._get_tool_task(step, index, flow)
 
         self._pre_process(step, index)
-        self._set_env_vars(step, index)
+        env = self._get_task_env(step, index)
 
         run_func = getattr(self._get_task_module(step, index, flow=flow), 'run', None)
-        (toolpath, version) = self._check_tool_version(step, index, run_func)
+        (toolpath, version) = self._check_tool_version(step, index, env, run_func)
 
         # Write manifest (tool interface) (Don't move this!)
         self.__write_task_manifest(tool)
@@ -3812,7 +3877,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         self.logger.debug("Starting executable")
         cpu_start = time.time()
 
-        self._run_executable_or_builtin(step, index, version, toolpath, workdir, run_func)
+        self._run_executable_or_builtin(step, index, version, toolpath, workdir, env, run_func)
 
         # Capture cpu runtime
         cpu_end = time.time()
@@ -3932,21 +3997,26 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
 
         # Gather core values.
         flow = self.get('option', 'flow')
+        jobdir = self._getworkdir()
+        design = self.get('design')
 
-        # Merge cfg back from last executed tasks.
-        for step, index in self._get_flowgraph_exit_nodes(flow, steplist=steplist):
-            lastdir = self._getworkdir(step=step, index=index)
+        exit_nodes = self._get_flowgraph_exit_nodes(flow, steplist=steplist)
 
-            # This no-op listdir operation is important for ensuring we have
-            # a consistent view of the filesystem when dealing with NFS.
-            # Without this, this thread is often unable to find the final
-            # manifest of runs performed on job schedulers, even if they
-            # completed successfully. Inspired by:
-            # https://stackoverflow.com/a/70029046.
+        # This no-op listdir operation is important for ensuring we have
+        # a consistent view of the filesystem when dealing with NFS.
+        # Without this, this thread is often unable to find the final
+        # manifest of runs performed on job schedulers, even if they
+        # completed successfully. Inspired by:
+        # https://stackoverflow.com/a/70029046.
+        # Indices of a step share a parent directory, so list each one once.
+        for step in dict.fromkeys(step for step, _ in exit_nodes):
+            os.listdir(os.path.join(jobdir, step))
 
-            os.listdir(os.path.dirname(lastdir))
+        # Merge cfg back from last executed tasks.
+        for step, index in exit_nodes:
+            lastdir = os.path.join(jobdir, step, index)
 
-            lastcfg = f"{lastdir}/outputs/{self.get('design')}.pkg.json"
+            lastcfg = f"{lastdir}/outputs/{design}.pkg.json"
             # Determine if the task was successful, using provided status dict
             # or the node Schema if no status dict is available.
             stat_success = False
@@ -4002,11 +4072,11 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 stem = self.get('option', 'jobname').rstrip('0123456789')
 
                 designdir = os.path.dirname(workdir)
-                jobid = 0
-                for job in os.listdir(designdir):
-                    m = re.match(stem + r'(\d+)', job)
-                    if m:
-                        jobid = max(jobid, int(m.group(1)))
+                job_re = re.compile(re.escape(stem) + r'(\d+)')
+                with os.scandir(designdir) as entries:
+                    matches = [job_re.match(entry.name) for entry in entries
+                               if entry.name.startswith(stem)]
+                jobid = max((int(m.group(1)) for m in matches if m), default=0)
                 self.set('option', 'jobname', f'{stem}{jobid + 1}')
 
     def _get_flow_steplist(self, flow):
@@ -4046,20 +4116,35 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         # manifests from _runtask() actually updates values.
         should_resume = self.get("option", 'resume')
         node_list = self._get_flowgraph_nodes(flow, steplist=steplist, indexlist=indexlist)
+        metrics = self.getkeys('metric')
+        records = self.getkeys('record')
+        jobdir = self._getworkdir()
+        design = self.get('design')
+
+        # List each step directory once rather than checking every node
+        # directory separately
+        node_dirs = {}
+        for step in self.getkeys('flowgraph', flow):
+            try:
+                with os.scandir(os.path.join(jobdir, step)) as entries:
+                    node_dirs[step] = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                node_dirs[step] = set()
+
         for (step, index) in self._get_flowgraph_nodes(flow):
-            stepdir = self._getworkdir(step=step, index=index)
-            cfg = f"{stepdir}/outputs/{self.get('design')}.pkg.json"
+            stepdir = os.path.join(jobdir, step, index)
+            cfg = f"{stepdir}/outputs/{design}.pkg.json"
 
-            if not os.path.isdir(stepdir) or ((step, index) in node_list and not should_resume):
+            if index not in node_dirs[step] or \
+                    ((step, index) in node_list and not should_resume):
                 # If stepdir doesn't exist, we need to re-run this task. If
                 # we're not running with -resume, we also re-run anything
                 # in the steplist.
                 self.set('flowgraph', flow, step, index, 'status', None)
 
                 # Reset metrics and records
-                for metric in self.getkeys('metric'):
-                    self._clear_metric(step, index, metric)
-                for record in self.getkeys('record'):
+                self._clear_metrics(step, index, metrics)
+                for record in records:
                     self._clear_record(step, index, record)
             elif os.path.isfile(cfg):
                 node_status = Schema(manifest=cfg).get('flowgraph', flow, step, index, 'status')
@@ -4079,18 +4164,22 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 for index in self.getkeys('flowgraph', flow, step):
                     if (step, index) in node_list:
                         self.set('flowgraph', flow, step, index, 'status', None)
-                        for metric in self.getkeys('metric'):
-                            self._clear_metric(step, index, metric)
-                        for record in self.getkeys('record'):
+                        self._clear_metrics(step, index, metrics)
+                        for record in records:
                             self._clear_record(step, index, record)
 
     def _prepare_nodes(self, nodes_to_run, processes, flow, status, steplist, indexlist):
         '''
         For each node to run, prepare a process and store its dependencies
         '''
-        # Ensure we use spawn for multiprocessing so loggers initialized correctly
+        # Run each node in a fresh interpreter so loggers are initialized
+        # correctly. On Linux, nodes are forked from a server process that has
+        # already imported siliconcompiler, so each node skips that import.
         jobname = self.get('option', 'jobname')
-        multiprocessor = multiprocessing.get_context('spawn')
+        multiprocessor = Chip._get_node_context()
+        use_forkserver = multiprocessor.get_start_method() == 'forkserver'
+        if use_forkserver:
+            environment = dict(os.environ)
         flowgraph_nodes = self._get_flowgraph_nodes(flow, steplist=steplist, indexlist=indexlist)
         for (step, index) in flowgraph_nodes:
             node = (step, index)
@@ -4104,8 +4193,40 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
             else:
                 nodes_to_run[node] = self.get('flowgraph', flow, step, index, 'input').copy()
 
-            processes[node] = multiprocessor.Process(target=self._runtask,
-                                                     args=(flow, step, index, status))
+            if use_forkserver:
+                processes[node] = multiprocessor.Process(target=self._runtask_in_env,
+                                                         args=(environment, flow, step, index,
+                                                               status))
+            else:
+                processes[node] = multiprocessor.Process(target=self._runtask,
+                                                         args=(flow, step, index, status))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_node_context():
+        '''
+        Returns the multiprocessing context used to launch nodes.
+
+        The forkserver preload list is process-wide state, so it is only set
+        the first time a context is requested.
+        '''
+        if sys.platform == 'linux':
+            context = multiprocessing.get_context('forkserver')
+            context.set_forkserver_preload(['siliconcompiler'])
+        else:
+            context = multiprocessing.get_context('spawn')
+        return context
+
+    def _runtask_in_env(self, environment, flow, step, index, status):
+        '''
+        Process target that runs _runtask() with the launching environment.
+
+        Processes started from a forkserver inherit the environment of the
+        server rather than that of the process which launched them.
+        '''
+        os.environ.clear()
+        os.environ.update(environment)
+        self._runtask(flow, step, index, status)
 
     def _check_node_dependencies(self, node, deps, status):
         dep_was_successful = False
@@ -4159,9 +4280,14 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 self.error('Nodes left to run, but no '
                            'running nodes. Steplist may be invalid.', fatal=True)
 
+            # Block until at least one running node exits, then mark completed
+            # nodes before the next launch pass so dependent nodes start as
+            # soon as their inputs complete.
+            if running_nodes:
+                multiprocessing.connection.wait(
+                    [processes[node].sentinel for node in running_nodes])
+
             # Check for completed nodes.
-            # TODO: consider staying in this section of loop until a node
-            # actually completes.
             for node in running_nodes.copy():
                 if not processes[node].is_alive():
                     running_nodes.remove(node)
@@ -4170,9 +4296,6 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                     else:
                         status[node] = NodeStatus.SUCCESS
 
-            # TODO: exponential back-off with max?
-            time.sleep(0.1)
-
     def _check_nodes_status(self, flow, status, steplist, indexlist):
         # Make a clean exit if one of the steps failed
         for step in steplist:
@@ -4486,6 +4609,17 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         return fullexe
 
     #######################################
+    @staticmethod
+    def _split_option(option, posix):
+        '''
+        Splits a tool option into arguments, like shlex.split().
+        '''
+        if not _UNSAFE_OPTION_CHARS.search(option):
+            # Without quotes, escapes or other whitespace, shlex only splits
+            # on spaces
+            return option.split()
+        return shlex.split(option, posix=posix)
+
     def _makecmd(self, tool, task, step, index, script_name='replay.sh', include_path=True):
         '''
         Constructs a subprocess run command based on eda tool setup.
@@ -4501,10 +4635,9 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         fullexe = self._getexe(tool, step, index)
 
         options = []
-        is_posix = (sys.platform != 'win32')
 
         for option in self.get('tool', tool, 'task', task, 'option', step=step, index=index):
-            options.extend(shlex.split(option, posix=is_posix))
+            options.extend(self._split_option(option, _IS_POSIX))
 
         # Add scripts files
         scripts = self.find_files('tool', tool, 'task', task, 'script', step=step, index=index)
@@ -4523,7 +4656,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 self.logger.error(f'Failed to get runtime options for {tool}/{task}')
                 raise e
             for option in options:
-                cmdlist.extend(shlex.split(option, posix=is_posix))
+                cmdlist.extend(self._split_option(option, _IS_POSIX))
 
         envvars = {}
         for key in self.getkeys('option', 'env'):
@@ -4546,7 +4679,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
                 envvars[key] = val
 
         nice = None
-        if is_posix:
+        if _IS_POSIX:
             nice = self.get('option', 'nice', step=step, index=index)
 
         nice_cmdlist = []
@@ -4559,21 +4692,26 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         cmdlist = [*nice_cmdlist, *cmdlist]
 
         # create replay file
-        with open(script_name, 'w') as f:
-            print('#!/usr/bin/env bash', file=f)
-
-            envvar_cmd = 'export'
-            for key, val in envvars.items():
-                print(f'{envvar_cmd} {key}="{val}"', file=f)
+        replay = ['#!/usr/bin/env bash']
 
-            # Ensure execution runs from the same directory
-            work_dir = self._getworkdir(step=step, index=index)
-            if self.__relative_path:
-                work_dir = os.path.relpath(work_dir, self.__relative_path)
-            print(f'cd {work_dir}', file=f)
-            print(' '.join(f'"{arg}"' if ' ' in arg else arg for arg in replay_cmdlist), file=f)
+        envvar_cmd = 'export'
+        for key, val in envvars.items():
+            replay.append(f'{envvar_cmd} {key}="{val}"')
 
-        os.chmod(script_name, 0o755)
+        # Ensure execution runs from the same directory
+        work_dir = self._getworkdir(step=step, index=index)
+        if self.__relative_path:
+            work_dir = os.path.relpath(work_dir, self.__relative_path)
+        replay.append(f'cd {work_dir}')
+        replay.append(' '.join(f'"{arg}"' if ' ' in arg else arg for arg in replay_cmdlist))
+
+        # Write to a temporary file and move it into place, so the script is
+        # never seen partially written
+        tmp_script_name = f'{script_name}.tmp'
+        with open(tmp_script_name, 'w') as f:
+            f.write('\n'.join(replay) + '\n')
+        os.chmod(tmp_script_name, 0o755)
+        os.replace(tmp_script_name, script_name)
 
         return cmdlist, ' '.join(replay_cmdlist), cmd, cmd_args
 
@@ -4585,6 +4723,7 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
 
     #######################################
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_machine_info():
         system = platform.system()
         if system == 'Darwin':
@@ -4657,61 +4796,50 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
     #######################################
     def __record_usermachine(self, step, index):
         machine_info = Chip._get_machine_info()
-        self.set('record', 'platform', machine_info['system'],
-                 step=step, index=index)
-
-        if machine_info['distro']:
-            self.set('record', 'distro', machine_info['distro'],
-                     step=step, index=index)
-
-        self.set('record', 'osversion', machine_info['osversion'],
-                 step=step, index=index)
-
-        if machine_info['kernelversion']:
-            self.set('record', 'kernelversion', machine_info['kernelversion'],
-                     step=step, index=index)
-
-        self.set('record', 'arch', machine_info['arch'],
-                 step=step, index=index)
+        records = {
+            'platform': machine_info['system'],
+            'osversion': machine_info['osversion'],
+            'arch': machine_info['arch'],
+            'userid': getpass.getuser(),
+            'machine': platform.node(),
+            'region': self._get_cloud_region()
+        }
 
-        userid = getpass.getuser()
-        self.set('record', 'userid', userid,
-                 step=step, index=index)
+        for record in ('distro', 'kernelversion'):
+            if machine_info[record]:
+                records[record] = machine_info[record]
 
-        machine = platform.node()
-        self.set('record', 'machine', machine,
-                 step=step, index=index)
+        network_info = Chip._get_network_info()
+        if network_info:
+            records['ipaddr'], records['macaddr'] = network_info
+        else:
+            self.logger.warning('Could not find default network interface info')
 
-        self.set('record', 'region', self._get_cloud_region(),
-                 step=step, index=index)
+        for record, value in records.items():
+            self.set('record', record, value, step=step, index=index)
 
+    #######################################
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_network_info():
+        '''
+        Returns (ipaddr, macaddr) of the default network interface, or None
+        '''
         try:
             gateways = netifaces.gateways()
             ipaddr, interface = gateways['default'][netifaces.AF_INET]
             macaddr = netifaces.ifaddresses(interface)[netifaces.AF_LINK][0]['addr']
-            self.set('record', 'ipaddr', ipaddr, step=step, index=index)
-            self.set('record', 'macaddr', macaddr, step=step, index=index)
         except KeyError:
-            self.logger.warning('Could not find default network interface info')
+            return None
+        return ipaddr, macaddr
 
     #######################################
     def _safecompare(self, value, op, goal):
-        # supported relational operations
-        # >, >=, <=, <. ==, !=
-        if op == ">":
-            return bool(value > goal)
-        elif op == ">=":
-            return bool(value >= goal)
-        elif op == "<":
-            return bool(value < goal)
-        elif op == "<=":
-            return bool(value <= goal)
-        elif op == "==":
-            return bool(value == goal)
-        elif op == "!=":
-            return bool(value != goal)
-        else:
+        compare = _COMPARE_OPS.get(op)
+        if compare is None:
             self.error(f"Illegal comparison operation {op}")
+            return None
+        return bool(compare(value, goal))
 
     #######################################
     def _is_builtin(self, tool, task):
@@ -4749,14 +4877,11 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         Collect all step/indices that represent the exit
         nodes for the flowgraph
         '''
-        inputnodes = []
-        for (step, index) in self._get_flowgraph_nodes(flow, steplist=steplist):
-            inputnodes.extend(self.get('flowgraph', flow, step, index, 'input'))
-        nodes = []
-        for (step, index) in self._get_flowgraph_nodes(flow, steplist=steplist):
-            if (step, index) not in inputnodes:
-                nodes.append((step, index))
-        return nodes
+        flowgraph_nodes = self._get_flowgraph_nodes(flow, steplist=steplist)
+        inputnodes = set()
+        for (step, index) in flowgraph_nodes:
+            inputnodes.update(self.get('flowgraph', flow, step, index, 'input'))
+        return [node for node in flowgraph_nodes if node not in inputnodes]
 
     #######################################
     def _getcollectdir(self, jobname=None):
@@ -4798,6 +4923,10 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         if not filepath:
             return None
 
+        if '$' not in filepath and '%' not in filepath:
+            # Nothing for expandvars to substitute on any platform
+            return filepath
+
         env_save = os.environ.copy()
         for env in self.getkeys('option', 'env'):
             os.environ[env] = self.get('option', 'env', env)
@@ -4815,11 +4944,16 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         return resolved_path
 
     #######################################
-    def _get_imported_filename(self, pathstr):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_imported_filename(pathstr):
         ''' Utility to map collected file to an unambiguous name based on its path.
 
         The mapping looks like:
         path/to/file.ext => file_<md5('path/to/file.ext')>.ext
+
+        Results are cached, since every lookup of a collected file maps each
+        leading part of its path.
         '''
         path = pathlib.Path(pathstr)
         ext = ''.join(path.suffixes)
@@ -4990,16 +5124,24 @@ If you are sure that your working directory is valid, try running `cd $(pwd)`.""
         Helper function to clear metrics records
         '''
 
-        # This function is often called in a loop; don't clear
-        # metrics which the caller wants to preserve.
-        if preserve and metric in preserve:
-            return
+        self._clear_metrics(step, index, [metric], preserve=preserve)
+
+    #######################################
+    def _clear_metrics(self, step, index, metrics, preserve=None):
+        '''
+        Helper function to clear a group of metrics records for a single node
+        '''
 
         flow = self.get('option', 'flow')
         tool, task = self._get_tool_task(step, index, flow=flow)
 
-        self.unset('metric', metric, step=step, index=index)
-        self.unset('tool', tool, 'task', task, 'report', metric, step=step, index=index)
+        for metric in metrics:
+            # Don't clear metrics which the caller wants to preserve.
+            if preserve and metric in preserve:
+                continue
+
+            self.unset('metric', metric, step=step, index=index)
+            self.unset('tool', tool, 'task', task, 'report', metric, step=step, index=index)
 
     #######################################
     def _clear_record(self, step, index, record, preserve=None):
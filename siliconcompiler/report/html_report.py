@@ -6,6 +6,20 @@ from jinja2 import Environment, FileSystemLoader
 
 from siliconcompiler.report.utils import _collect_data, _find_summary_image
 
+# Jinja environments keyed by template directory, kept for the lifetime of
+# the process so the report template is only loaded and compiled once.
+_jinja_envs = {}
+
+
+def _get_report_template(templ_dir, name):
+    '''
+    Returns the compiled template from the cached environment for templ_dir
+    '''
+    if templ_dir not in _jinja_envs:
+        _jinja_envs[templ_dir] = Environment(loader=FileSystemLoader(templ_dir),
+                                             auto_reload=False)
+    return _jinja_envs[templ_dir].get_template(name)
+
 
 def _generate_html_report(chip, flow, steplist, results_html):
     '''
@@ -14,13 +28,9 @@ def _generate_html_report(chip, flow, steplist, results_html):
     templ_dir = os.path.join(chip.scroot, 'templates', 'report')
 
     # only report tool based steps functions
-    for step in steplist.copy():
-        tool, task = chip._get_tool_task(step, '0', flow=flow)
-        if chip._is_builtin(tool, task):
-            index = steplist.index(step)
-            del steplist[index]
+    steplist = [step for step in steplist
+                if not chip._is_builtin(*chip._get_tool_task(step, '0', flow=flow))]
 
-    env = Environment(loader=FileSystemLoader(templ_dir))
     schema = chip.schema.copy()
     schema.prune()
     pruned_cfg = schema.cfg
@@ -45,7 +55,7 @@ def _generate_html_report(chip, flow, steplist, results_html):
     # this write may raise an encoding error on machines where the
     # default encoding is not UTF-8.
     with open(results_html, 'w', encoding='utf-8') as wf:
-        wf.write(env.get_template('sc_report.j2').render(
+        wf.write(_get_report_template(templ_dir, 'sc_report.j2').render(
             design=chip.design,
             nodes=nodes,
             errors=errors,
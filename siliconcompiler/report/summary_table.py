@@ -20,11 +20,8 @@ def _show_summary_table(chip, flow, steplist, show_all_indices):
         _get_flowgraph_path(chip, flow, steplist, only_include_successful=True)
 
     # only report tool based steps functions
-    for step in steplist.copy():
-        tool, task = chip._get_tool_task(step, '0', flow=flow)
-        if chip._is_builtin(tool, task):
-            index = steplist.index(step)
-            del steplist[index]
+    steplist = [step for step in steplist
+                if not chip._is_builtin(*chip._get_tool_task(step, '0', flow=flow))]
 
     if show_all_indices:
         nodes_to_show = nodes
@@ -16,11 +16,8 @@ def _collect_data(chip, flow=None, steplist=None, format_as_string=True):
     if not steplist:
         steplist = chip.list_steps()
         # only report tool based steps functions
-        for step in steplist.copy():
-            tool, task = chip._get_tool_task(step, '0', flow=flow)
-            if chip._is_builtin(tool, task):
-                index = steplist.index(step)
-                del steplist[index]
+        steplist = [step for step in steplist
+                    if not chip._is_builtin(*chip._get_tool_task(step, '0', flow=flow))]
 
     # Collections for data
     nodes = []
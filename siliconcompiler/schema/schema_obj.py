@@ -10,6 +10,7 @@ import gzip
 import json
 import logging
 import os
+import pickle
 import re
 import pathlib
 
@@ -19,9 +20,25 @@ try:
 except ImportError:
     _has_yaml = False
 
+try:
+    import orjson
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
 from .schema_cfg import schema_cfg
 from .utils import escape_val_tcl, PACKAGE_ROOT
 
+# Python types of values that are already normalized for a schema type
+_NORMALIZED_TYPES = {
+    'str': str,
+    'file': str,
+    'dir': str,
+    'int': int,
+    'float': float,
+    'bool': bool
+}
+
 
 class Schema:
     """Object for storing and accessing configuration values corresponding to
@@ -54,7 +71,7 @@ class Schema:
         self._init_logger(logger)
 
         if cfg is not None:
-            self.cfg = Schema._dict_to_schema(copy.deepcopy(cfg))
+            self.cfg = Schema._dict_to_schema(Schema._copy_cfg(cfg))
         elif manifest is not None:
             # Normalize value to string in case we receive a pathlib.Path
             manifest = str(manifest)
@@ -103,6 +120,17 @@ class Schema:
                 Schema._dict_to_schema_set(cfg[category], category)
         return cfg
 
+    ###########################################################################
+    @staticmethod
+    def _copy_cfg(cfg):
+        '''
+        Returns a deep copy of a configuration dictionary.
+
+        The schema only holds plain data, so a pickle round trip gives the same
+        result as copy.deepcopy() in a fraction of the time.
+        '''
+        return pickle.loads(pickle.dumps(cfg, protocol=pickle.HIGHEST_PROTOCOL))
+
     ###########################################################################
     @staticmethod
     def _read_manifest(filepath):
@@ -112,11 +140,20 @@ class Schema:
         if os.path.splitext(filepath)[1].lower() == '.gz':
             fin = gzip.open(filepath, 'r')
         else:
-            fin = open(filepath, 'r')
+            fin = open(filepath, 'rb')
 
         try:
             if re.search(r'(\.json|\.sup)(\.gz)*$', filepath, flags=re.IGNORECASE):
-                localcfg = json.load(fin)
+                if _has_orjson:
+                    data = fin.read()
+                    try:
+                        localcfg = orjson.loads(data)
+                    except orjson.JSONDecodeError:
+                        # orjson rejects NaN/Infinity and large integers,
+                        # which json accepts
+                        localcfg = json.loads(data)
+                else:
+                    localcfg = json.load(fin)
             elif re.search(r'(\.yaml|\.yml)(\.gz)*$', filepath, flags=re.IGNORECASE):
                 if not _has_yaml:
                     raise ImportError('yaml package required to read YAML manifest')
@@ -418,7 +455,7 @@ class Schema:
         documentation.
         """
         cfg = self._search(*keypath)
-        return copy.deepcopy(cfg)
+        return Schema._copy_cfg(cfg)
 
     ###########################################################################
     def valid(self, *args, default_valid=False):
@@ -461,7 +498,7 @@ class Schema:
 
         # initialize new dict
         jobname = self.get('option', 'jobname')
-        self.cfg['history'][jobname] = {}
+        history = {}
 
         # copy in all empty values of scope job
         allkeys = self.allkeys()
@@ -471,9 +508,13 @@ class Schema:
                 scope = self.get(*key, field='scope')
                 if not self._is_empty(*key) and (scope == 'job'):
                     self._copyparam(self.cfg,
-                                    self.cfg['history'][jobname],
+                                    history,
                                     key)
 
+        # Copy all collected parameters at once, which is much faster than
+        # deep copying each one separately
+        self.cfg['history'][jobname] = Schema._copy_cfg(history)
+
     @staticmethod
     def _check_and_normalize(value, sc_type, field, keypath, allowed_values):
         '''
@@ -507,6 +548,16 @@ class Schema:
             return value
 
         if field == 'value':
+            # Values that are already normalized are returned as-is (lists are
+            # still copied), skipping the error message and recursion
+            if sc_type.startswith('['):
+                base_type = _NORMALIZED_TYPES.get(sc_type[1:-1])
+                if base_type and isinstance(value, list) and \
+                        all(type(v) is base_type for v in value):
+                    return list(value)
+            elif type(value) is _NORMALIZED_TYPES.get(sc_type):
+                return value
+
             # Push down error_msg from the top since arguments get modified in recursive call
             error_msg = f'Invalid value {value} for keypath {keypath}: expected type {sc_type}'
             return Schema._normalize_value(value, sc_type, error_msg, allowed_values)
@@ -781,7 +832,8 @@ class Schema:
     ###########################################################################
     def _copyparam(self, cfgsrc, cfgdst, keypath):
         '''
-        Copies a parameter into the manifest history dictionary.
+        Links a parameter into the manifest history dictionary. The fields are
+        not copied, so the caller is responsible for copying the result.
         '''
 
         # 1. descend keypath, pop each key as its used
@@ -796,7 +848,7 @@ class Schema:
         else:
             for key in cfgsrc.keys():
                 if key not in ('example', 'switch', 'help'):
-                    cfgdst[key] = copy.deepcopy(cfgsrc[key])
+                    cfgdst[key] = cfgsrc[key]
 
     ###########################################################################
     def write_json(self, fout):
@@ -1,3 +1,4 @@
+import numpy
 
 from siliconcompiler import NodeStatus
 from siliconcompiler import utils
@@ -30,17 +31,16 @@ def _mux(chip, *steps, operations=None):
         if op not in ('minimum', 'maximum'):
             raise ValueError('Invalid op')
 
-        values = [chip.get('metric', metric, step=step, index=index) for step, index in candidates]
-
-        if op == 'minimum':
-            target = min(values)
-        else:
-            target = max(values)
-
+        # Track the best value and the nodes that reach it in a single pass
+        target = None
         winners = []
-        for value, node in zip(values, candidates):
-            if value == target:
-                winners.append(node)
+        for step, index in candidates:
+            value = chip.get('metric', metric, step=step, index=index)
+            if not winners or (value < target if op == 'minimum' else value > target):
+                target = value
+                winners = [(step, index)]
+            elif value == target:
+                winners.append((step, index))
         candidates = winners
 
         if len(candidates) == 1:
@@ -70,68 +70,78 @@ def _minmax(chip, *steps, op=None):
     for step, index in steplist:
         if step not in failed:
             failed[step] = {}
-        failed[step][index] = False
-
-        if chip.get('flowgraph', flow, step, index, 'status') == NodeStatus.ERROR:
-            failed[step][index] = True
-        else:
-            for metric in chip.getkeys('metric'):
-                if chip.valid('flowgraph', flow, step, index, 'goal', metric):
-                    goal = chip.get('flowgraph', flow, step, index, 'goal', metric)
-                    real = chip.get('metric', metric, step=step, index=index)
-                    if real is None:
-                        chip.error(f'Metric {metric} has goal for {step}{index} '
-                                   'but it has not been set.', fatal=True)
-                    if abs(real) > goal:
-                        chip.logger.warning(f"Step {step}{index} failed "
-                                            f"because it didn't meet goals for '{metric}' "
-                                            "metric.")
-                        failed[step][index] = True
-
-    # Calculate max/min values for each metric
-    max_val = {}
-    min_val = {}
-    for metric in chip.getkeys('metric'):
-        max_val[metric] = 0
-        min_val[metric] = float("inf")
-        for step, index in steplist:
-            if not failed[step][index]:
-                real = chip.get('metric', metric, step=step, index=index)
+        failed[step][index] = \
+            chip.get('flowgraph', flow, step, index, 'status') == NodeStatus.ERROR
+
+    # Snapshot metric values and goals of the remaining nodes into arrays.
+    # Unset values are stored as NaN and missing goals as inf, so neither
+    # can cause a node to fail its goals.
+    metrics = chip.getkeys('metric')
+    nodes = [(step, index) for step, index in steplist if not failed[step][index]]
+    reals = numpy.full((len(nodes), len(metrics)), numpy.nan)
+    goals = numpy.full((len(nodes), len(metrics)), numpy.inf)
+    for n, (step, index) in enumerate(nodes):
+        for m, metric in enumerate(metrics):
+            real = chip.get('metric', metric, step=step, index=index)
+            if real is not None:
+                reals[n, m] = real
+            if chip.valid('flowgraph', flow, step, index, 'goal', metric):
                 if real is None:
-                    continue
-                max_val[metric] = max(max_val[metric], real)
-                min_val[metric] = min(min_val[metric], real)
-
-    # Select the minimum index
-    best_score = float('inf') if op == 'minimum' else float('-inf')
-    winner = None
-    for step, index in steplist:
-        if failed[step][index]:
-            continue
-
-        score = 0.0
+                    chip.error(f'Metric {metric} has goal for {step}{index} '
+                               'but it has not been set.', fatal=True)
+                goals[n, m] = chip.get('flowgraph', flow, step, index, 'goal', metric)
+
+    with numpy.errstate(invalid='ignore'):
+        missed = numpy.abs(reals) > goals
+    for n, m in zip(*numpy.nonzero(missed)):
+        step, index = nodes[n]
+        chip.logger.warning(f"Step {step}{index} failed "
+                            f"because it didn't meet goals for '{metrics[m]}' "
+                            "metric.")
+
+    # Calculate max/min values for each metric, ignoring unset values
+    passed = ~missed.any(axis=1)
+    max_val = numpy.fmax.reduce(reals[passed], axis=0, initial=0)
+    min_val = numpy.fmin.reduce(reals[passed], axis=0, initial=numpy.inf)
+
+    # Gather the weights of the nodes that met their goals, 0 if unset
+    metric_pos = {metric: m for m, metric in enumerate(metrics)}
+    weights = numpy.zeros(reals.shape)
+    for n in numpy.flatnonzero(passed):
+        step, index = nodes[n]
         for metric in chip.getkeys('flowgraph', flow, step, index, 'weight'):
             weight = chip.get('flowgraph', flow, step, index, 'weight', metric)
             if not weight:
                 # skip if weight is 0 or None
                 continue
 
-            real = chip.get('metric', metric, step=step, index=index)
-            if real is None:
+            if numpy.isnan(reals[n, metric_pos[metric]]):
                 chip.error(f'Metric {metric} has weight for {step}{index} '
                            'but it has not been set.', fatal=True)
+            weights[n, metric_pos[metric]] = weight
 
-            if not (max_val[metric] - min_val[metric]) == 0:
-                scaled = (real - min_val[metric]) / (max_val[metric] - min_val[metric])
-            else:
-                scaled = max_val[metric]
-            score = score + scaled * weight
+    candidates = numpy.flatnonzero(passed)
+    if len(candidates) == 0:
+        return (float('inf') if op == 'minimum' else float('-inf'), None)
+
+    if len(candidates) == 1:
+        # A single node spans no range, so each metric scales to max_val
+        winner = candidates[0]
+        return ((max_val * weights[winner]).sum().item(), nodes[winner])
 
-        if ((op == 'minimum' and score < best_score) or (op == 'maximum' and score > best_score)):
-            best_score = score
-            winner = (step, index)
+    # Normalize every metric to its range and score all nodes at once
+    span = max_val - min_val
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        scaled = numpy.where(span != 0, (reals - min_val) / span, max_val)
+        scores = numpy.where(weights != 0, scaled * weights, 0).sum(axis=1)
+
+    # Select the minimum index
+    if op == 'minimum':
+        winner = candidates[numpy.argmin(scores[candidates])]
+    else:
+        winner = candidates[numpy.argmax(scores[candidates])]
 
-    return (best_score, winner)
+    return (scores[winner].item(), nodes[winner])
 
 
 def run(chip):
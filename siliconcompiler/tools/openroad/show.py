@@ -1,6 +1,6 @@
-import shutil
 import os
 
+from siliconcompiler import utils
 from siliconcompiler.tools.openroad import openroad
 from siliconcompiler.tools.openroad.openroad import setup as setup_tool
 from siliconcompiler.tools.openroad.openroad import build_pex_corners
@@ -79,15 +79,15 @@ def copy_show_files(chip):
         show_index = chip.get('tool', tool, 'task', task, 'var', 'show_index',
                               step=step, index=index)
 
-        # copy source in to keep sc_apr.tcl simple
+        # link source in to keep sc_apr.tcl simple, since layouts can be large
         dst_file = f"inputs/{chip.top()}.{show_type}"
-        shutil.copy2(show_file, dst_file)
+        utils.link_or_copy(show_file, dst_file)
         if show_job and show_step and show_index:
             sdc_file = chip.find_result('sdc', show_step[0],
                                         jobname=show_job[0],
                                         index=show_index[0])
             if sdc_file and os.path.exists(sdc_file):
-                shutil.copy2(sdc_file, f"inputs/{chip.top()}.sdc")
+                utils.link_or_copy(sdc_file, f"inputs/{chip.top()}.sdc")
 
 
 def find_incoming_ext(chip):
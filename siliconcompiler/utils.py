@@ -17,36 +17,48 @@ def copytree(src, dst, ignore=[], dirs_exist_ok=False, link=False):
     '''
     os.makedirs(dst, exist_ok=dirs_exist_ok)
 
-    for name in os.listdir(src):
-        if name in ignore:
-            continue
-
-        srcfile = os.path.join(src, name)
-        dstfile = os.path.join(dst, name)
-
-        if os.path.islink(srcfile):
-            # Get the true filepath if its a link
-            srcfile = os.path.realpath(srcfile)
-
-        if os.path.isdir(srcfile):
-            # Continue to copy the hierarchy
-            copytree(srcfile, dstfile,
-                     ignore=ignore,
-                     dirs_exist_ok=dirs_exist_ok,
-                     link=link)
-        elif link:
-            # first try hard linking, then symbolic linking,
-            # and finally just copy the file
-            for method in [os.link, os.symlink, shutil.copy2]:
-                try:
-                    # create link
-                    method(srcfile, dstfile)
-                    # success, no need to continue trying
-                except OSError:
-                    pass
-        else:
-            # copy file
-            shutil.copy2(srcfile, dstfile)
+    # scandir entries carry their file type, avoiding extra stat calls per file
+    with os.scandir(src) as entries:
+        for entry in entries:
+            if entry.name in ignore:
+                continue
+
+            srcfile = entry.path
+            dstfile = os.path.join(dst, entry.name)
+
+            if entry.is_symlink():
+                # Get the true filepath if its a link
+                srcfile = os.path.realpath(srcfile)
+
+            if entry.is_dir():
+                # Continue to copy the hierarchy
+                copytree(srcfile, dstfile,
+                         ignore=ignore,
+                         dirs_exist_ok=dirs_exist_ok,
+                         link=link)
+            elif link:
+                link_or_copy(srcfile, dstfile)
+            else:
+                # copy file
+                shutil.copy2(srcfile, dstfile)
+
+
+def link_or_copy(src, dst):
+    '''Make dst refer to the contents of file src without copying if possible.
+
+    Tries a hard link first, then a symbolic link, and finally copies the file.
+    Errors from the final copy are raised to the caller.
+    '''
+    for method in [os.link, os.symlink]:
+        try:
+            # create link
+            method(src, dst)
+            # success, no need to continue trying
+            return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
 
 
 def terminate_process(pid, timeout=3):
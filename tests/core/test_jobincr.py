@@ -19,3 +19,24 @@ def test_jobincr():
 
     chip.run()
     assert chip._getworkdir().split(os.sep)[-3:] == ['build', 'test', 'job1']
+
+
+def test_jobincr_escape_jobname():
+    chip = siliconcompiler.Chip('test')
+    flow = 'test'
+    chip.set('option', 'flow', flow)
+    chip.set('option', 'mode', 'asic')
+    chip.node(flow, 'import', nop)
+
+    chip.set('option', 'jobname', 'job+1')
+    chip.set('option', 'jobincr', True)
+
+    # Directories that only match the jobname as a regular expression
+    os.makedirs(os.path.join('build', 'test', 'jobb5'))
+    os.makedirs(os.path.join('build', 'test', 'jobX5'))
+
+    chip.run()
+    assert chip._getworkdir().split(os.sep)[-3:] == ['build', 'test', 'job+1']
+
+    chip.run()
+    assert chip._getworkdir().split(os.sep)[-3:] == ['build', 'test', 'job+2']
@@ -0,0 +1,37 @@
+import shlex
+import sys
+
+import pytest
+
+import siliconcompiler
+
+from tests.core.tools.sleep import sleep
+from tests.core.tools.wait import wait
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Requires a POSIX shell')
+def test_launch_independent_branch():
+    '''Ensure a node is launched as soon as its inputs complete instead of
+    waiting on an unrelated, slower node.'''
+    chip = siliconcompiler.Chip('test')
+    chip.set('option', 'quiet', True)
+    chip.set('option', 'mode', 'asic')
+
+    flow = 'test'
+    chip.set('option', 'flow', flow)
+    chip.node(flow, 'fast', sleep)
+    chip.node(flow, 'slow', wait)
+    chip.node(flow, 'next', sleep)
+    chip.edge(flow, 'fast', 'next')
+
+    # 'slow' only succeeds once 'next' has completed, which requires 'next'
+    # to be launched while 'slow' is still running.
+    next_manifest = '../../next/0/outputs/test.pkg.json'
+    script = f'for i in $(seq 600); do [ -f {next_manifest} ] && exit 0; sleep 0.1; done; exit 1'
+    chip.set('tool', 'wait', 'task', 'wait', 'option', f'-c {shlex.quote(script)}',
+             step='slow', index='0')
+
+    chip.run()
+
+    assert chip.get('flowgraph', flow, 'slow', '0', 'status') == \
+        siliconcompiler.NodeStatus.SUCCESS
@@ -1,5 +1,6 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
 import os
+import math
 import siliconcompiler
 import json
 import packaging.version
@@ -95,6 +96,23 @@ def test_read_job():
     assert chip2.get('input', 'rtl', 'verilog', job='job1', step='import', index=0) == ['foo.v']
 
 
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_read_nan(monkeypatch, use_orjson):
+    '''Make sure manifests containing values only json can decode are read'''
+    from siliconcompiler.schema import schema_obj
+    if use_orjson and not schema_obj._has_orjson:
+        pytest.skip('orjson not installed')
+    monkeypatch.setattr(schema_obj, '_has_orjson', use_orjson)
+
+    chip = siliconcompiler.Chip('foo')
+    chip.set('metric', 'cellarea', float('nan'), step='syn', index='0')
+    chip.write_manifest('tmp.json')
+
+    chip2 = siliconcompiler.Chip('foo')
+    chip2.read_manifest('tmp.json')
+    assert math.isnan(chip2.get('metric', 'cellarea', step='syn', index='0'))
+
+
 #########################
 if __name__ == "__main__":
     from tests.fixtures import datadir
@@ -0,0 +1,25 @@
+import os
+
+import siliconcompiler
+
+from siliconcompiler.tools.builtin import nop
+
+
+def test_rerun_clears_workdir():
+    chip = siliconcompiler.Chip('test')
+    flow = 'test'
+    chip.set('option', 'flow', flow)
+    chip.set('option', 'mode', 'asic')
+    chip.node(flow, 'import', nop)
+
+    chip.run()
+
+    workdir = chip._getworkdir(step='import', index='0')
+    with open(os.path.join(workdir, 'stale.txt'), 'w') as f:
+        f.write('stale')
+
+    chip.run()
+
+    # The old results must be removed, not moved aside in the job directory
+    assert os.listdir(os.path.dirname(workdir)) == ['0']
+    assert not os.path.exists(os.path.join(workdir, 'stale.txt'))
@@ -0,0 +1,8 @@
+def setup(chip):
+    step = chip.get('arg', 'step')
+    index = chip.get('arg', 'index')
+    tool, task = chip._get_tool_task(step, index)
+
+    chip.set('tool', tool, 'exe', 'sleep')
+    chip.set('tool', tool, 'task', task, 'option', '0',
+             step=step, index=index, clobber=False)